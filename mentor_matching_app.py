@@ -2,11 +2,17 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import concurrent.futures
+from dataclasses import dataclass
 from datetime import datetime
+import functools
+import queue
 import re
+import string
+import threading
+import time
 from typing import List, Dict, Tuple
 import json
-import smtplib
 # Load email settings from Streamlit Secrets
 def load_email_settings():
     """Load email configuration from Streamlit Secrets"""
@@ -17,7 +23,8 @@ def load_email_settings():
                 'smtp_port': int(st.secrets["email"]["smtp_port"]),
                 'sender_email': st.secrets["email"]["sender_email"],
                 'sender_password': st.secrets["email"]["sender_password"],
-                'use_email': st.secrets["email"].get("use_email", True)
+                'use_email': st.secrets["email"].get("use_email", True),
+                'use_ssl': st.secrets["email"].get("use_ssl", False)
             }
     except Exception as e:
         st.error(f"Error loading email secrets: {e}")
@@ -28,10 +35,23 @@ def load_email_settings():
         'smtp_port': 587,
         'sender_email': '',
         'sender_password': '',
-        'use_email': False
+        'use_email': False,
+        'use_ssl': False
     }
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+
+# The email stack is only needed once a message is actually sent; import
+# it lazily so Streamlit cold starts don't pay for it
+smtplib = ssl = MIMEText = MIMEMultipart = None
+
+def _ensure_email_imports() -> None:
+    """Import smtplib, ssl and the MIME classes on first use"""
+    global smtplib, ssl, MIMEText, MIMEMultipart
+    if smtplib is None:
+        import smtplib as _smtplib
+        import ssl as _ssl
+        from email.mime.text import MIMEText as _MIMEText
+        from email.mime.multipart import MIMEMultipart as _MIMEMultipart
+        smtplib, ssl, MIMEText, MIMEMultipart = _smtplib, _ssl, _MIMEText, _MIMEMultipart
 
 # Page configuration
 st.set_page_config(
@@ -40,22 +60,34 @@ st.set_page_config(
     layout="wide"
 )
 
+# Arrow-backed string columns are ~2x smaller and serve the .str
+# accessor faster; fall back to plain object columns without pyarrow
+try:
+    import pyarrow  # noqa: F401
+    _TABLE_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _TABLE_DTYPE = object
+
+# Match lifecycle states, in display order
+STATUSES = ("Proposed", "Confirmed", "Active", "Completed", "Declined")
+STATUS_INDEX = {status: i for i, status in enumerate(STATUSES)}
+
 # Initialize session state for data persistence
 if 'mentors' not in st.session_state:
-    st.session_state.mentors = pd.DataFrame(columns=[
-        'MentorID', 'Name', 'Email', 'Institution', 'Role/Title', 'City', 
-        'Country', 'TimeZone', 'Gender', 'Languages', 'Sectors', 
-        'Expertise', 'Functions', 'Seniority', 'MaxMentees', 
+    st.session_state.mentors = pd.DataFrame({col: pd.array([], dtype=_TABLE_DTYPE) for col in [
+        'MentorID', 'Name', 'Email', 'Institution', 'Role/Title', 'City',
+        'Country', 'TimeZone', 'Gender', 'Languages', 'Sectors',
+        'Expertise', 'Functions', 'Seniority', 'MaxMentees',
         'Availability', 'Format', 'LinkedIn', 'Conflicts', 'Notes'
-    ])
+    ]})
 
 if 'mentees' not in st.session_state:
-    st.session_state.mentees = pd.DataFrame(columns=[
+    st.session_state.mentees = pd.DataFrame({col: pd.array([], dtype=_TABLE_DTYPE) for col in [
         'MenteeID', 'Name', 'Email', 'Institution', 'LPOC', 'ParticipantType',
-        'ProjectName', 'Stage', 'Sector', 'Needs', 'TopDecision', 
-        'Goals', 'Languages', 'City', 'Country', 'TimeZone', 
+        'ProjectName', 'Stage', 'Sector', 'Needs', 'TopDecision',
+        'Goals', 'Languages', 'City', 'Country', 'TimeZone',
         'Availability', 'Format', 'Brief', 'Gender', 'Consent', 'Notes'
-    ])
+    ]})
 
 if 'matches' not in st.session_state:
     st.session_state.matches = pd.DataFrame(columns=[
@@ -66,145 +98,347 @@ if 'matches' not in st.session_state:
     ])
 
 
+def _read_import_csv(uploaded_file) -> pd.DataFrame:
+    """Parse an uploaded CSV, preferring the multithreaded pyarrow engine"""
+    try:
+        df = pd.read_csv(uploaded_file, engine='pyarrow')
+    except (ImportError, ValueError):
+        # pyarrow missing or the file needs the more forgiving default parser
+        uploaded_file.seek(0)
+        df = pd.read_csv(uploaded_file)
+
+    # Align string columns with the session tables so the bulk-import
+    # concat keeps the Arrow backing instead of upcasting to object
+    if _TABLE_DTYPE is not object:
+        object_cols = [col for col in df.columns if df[col].dtype == object]
+        if object_cols:
+            df[object_cols] = df[object_cols].astype(_TABLE_DTYPE)
+    return df
+
+def _append_row(df: pd.DataFrame, row: dict) -> None:
+    """Append one row in place, without the full-copy pd.concat round trip
+
+    Uses a fresh index label so appends stay safe after deletions leave
+    gaps in the index.
+    """
+    df.loc[(df.index.max() + 1) if len(df) else 0] = row
+
 if 'email_settings' not in st.session_state:
     st.session_state.email_settings = load_email_settings()
         
     # Email functions
-def send_match_notification_email(mentor_email: str, mentee_email: str, 
-                                  mentor_name: str, mentee_name: str, 
-                                  project_name: str, match_score: float, 
-                                  rationale: str, lpoc_email: str = None):
+def _get_smtp(settings: dict = None) -> 'smtplib.SMTP':
+    """Return the session's authenticated SMTP connection, creating or
+    reviving it as needed
+
+    The TLS handshake and AUTH are paid once per session instead of once
+    per email; a NOOP keepalive detects dropped connections and
+    transparently reconnects. The connection is keyed on
+    (server, port, sender, use_ssl, password hash), so editing any of
+    them - including just the password - forces a fresh login.
+    Pass `settings` to use values other than the saved ones (the
+    test-email form sends with its unsaved fields).
     """
-    Send email notification to mentor, mentee, and optionally LPOC about new match
+    _ensure_email_imports()
+    if settings is None:
+        settings = st.session_state.email_settings
+    # The password rides along as a session-local hash so editing only
+    # the password still forces a fresh login
+    key = (settings['smtp_server'], settings['smtp_port'],
+           settings['sender_email'], bool(settings.get('use_ssl')),
+           hash(settings['sender_password']))
+
+    conn = st.session_state.get('_smtp_conn')
+    if conn is not None and st.session_state.get('_smtp_key') == key:
+        try:
+            conn.noop()
+            return conn
+        except (smtplib.SMTPException, OSError):
+            pass
+    st.session_state._smtp_conn = None
+
+    conn = _open_smtp(settings)
+    st.session_state._smtp_conn = conn
+    st.session_state._smtp_key = key
+    return conn
+
+def _open_smtp(settings: dict) -> 'smtplib.SMTP':
+    """Open and authenticate one SMTP connection per the settings
+
+    Uses implicit TLS (SMTP_SSL) when use_ssl is set or the port is 465,
+    which saves the extra STARTTLS round trip; otherwise the classic
+    connect-then-STARTTLS path.
     """
-    if not st.session_state.email_settings['use_email']:
-        return False, "Email notifications not configured"
+    _ensure_email_imports()
+    if settings.get('use_ssl') or settings['smtp_port'] == 465:
+        conn = smtplib.SMTP_SSL(settings['smtp_server'], settings['smtp_port'],
+                                context=ssl.create_default_context())
+    else:
+        conn = smtplib.SMTP(settings['smtp_server'], settings['smtp_port'])
+        conn.starttls()
+    conn.login(settings['sender_email'], settings['sender_password'])
+    return conn
 
-    try:
-        # Email content
-        subject = f"🤝 New Mentor Match - RUN-InnoBoost Program"
+# Composed once at import; each send is a single substitute() call
+_MATCH_SUBJECT = "🤝 New Mentor Match - RUN-InnoBoost Program"
 
-        # Email to Mentor
-        mentor_body = f"""
-Dear {mentor_name},
+_MENTOR_BODY_TMPL = string.Template("""
+Dear $mentor_name,
 
 Great news! You have been matched with a new mentee in the RUN-InnoBoost mentoring program.
 
 MATCH DETAILS:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Mentee: {mentee_name}
-Project: {project_name}
-Match Score: {match_score:.1f}/100
-Rationale: {rationale}
+Mentee: $mentee_name
+Project: $project_name
+Match Score: $match_score/100
+Rationale: $rationale
 
 NEXT STEPS:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-1. Reply to this email to introduce yourself to {mentee_name} (CC'd)
+1. Reply to this email to introduce yourself to $mentee_name (CC'd)
 2. Schedule your first mentoring session within the next 2 weeks
 3. Prepare by reviewing the mentee's project information
 
 MENTEE CONTACT:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Email: {mentee_email}
+Email: $mentee_email
 
 Thank you for your commitment to supporting entrepreneurship in Portugal!
 
 Best regards,
 RUN-InnoBoost Team
 Startup Leiria
-"""
+""")
 
-        # Email to Mentee
-        mentee_body = f"""
-Dear {mentee_name},
+_TEST_SUBJECT = "Test Email - RUN-InnoBoost Mentor Matching System"
 
-Congratulations! We have matched you with an experienced mentor for your project "{project_name}".
-
-MATCH DETAILS:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Mentor: {mentor_name}
-Match Score: {match_score:.1f}/100
-Why this match: {rationale}
-
-NEXT STEPS:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-1. Reply to this email to introduce yourself and your project (CC'd with mentor)
-2. Schedule your first mentoring session within the next 2 weeks
-3. Prepare 3-5 specific questions or challenges to discuss
+_TEST_BODY = """
+This is a test email from the RUN-InnoBoost Mentor Matching System.
 
-MENTOR CONTACT:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Email: {mentor_email}
+If you received this email, your SMTP configuration is working correctly! ✅
 
-Make the most of this opportunity! Your mentor is here to help you succeed.
+You can now enable automatic email notifications for mentor-mentee matches.
 
 Best regards,
 RUN-InnoBoost Team
-Startup Leiria
 """
 
-        # Setup SMTP connection
-        smtp_server = st.session_state.email_settings['smtp_server']
-        smtp_port = st.session_state.email_settings['smtp_port']
-        sender_email = st.session_state.email_settings['sender_email']
-        sender_password = st.session_state.email_settings['sender_password']
-
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()
-        server.login(sender_email, sender_password)
+def _make_test_message(sender_email: str, to_email: str) -> 'MIMEMultipart':
+    """Compose the constant-body test email; only the addresses vary"""
+    _ensure_email_imports()
+    msg = MIMEMultipart()
+    msg['From'] = sender_email
+    msg['To'] = to_email
+    msg['Subject'] = _TEST_SUBJECT
+    msg.attach(MIMEText(_TEST_BODY, 'plain'))
+    return msg
+
+def _build_match_message(sender_email: str, mentor_email: str, mentee_email: str,
+                         mentor_name: str, mentee_name: str,
+                         project_name: str, match_score: float,
+                         rationale: str, lpoc_email: str = None) -> 'MIMEMultipart':
+    """Compose the match notification message (to mentor, mentee CC'd)"""
+    _ensure_email_imports()
+    mentor_body = _MENTOR_BODY_TMPL.substitute(
+        mentor_name=mentor_name,
+        mentee_name=mentee_name,
+        project_name=project_name,
+        match_score=f"{match_score:.1f}",
+        rationale=rationale,
+        mentee_email=mentee_email,
+    )
+
+    msg_mentor = MIMEMultipart()
+    msg_mentor['From'] = sender_email
+    msg_mentor['To'] = mentor_email
+    msg_mentor['Cc'] = mentee_email
+    if lpoc_email:
+        msg_mentor['Cc'] = f"{mentee_email}, {lpoc_email}"
+    msg_mentor['Subject'] = _MATCH_SUBJECT
+    msg_mentor.attach(MIMEText(mentor_body, 'plain'))
+    return msg_mentor
+
+def send_match_notification_email(mentor_email: str, mentee_email: str,
+                                  mentor_name: str, mentee_name: str,
+                                  project_name: str, match_score: float,
+                                  rationale: str, lpoc_email: str = None):
+    """
+    Send email notification to mentor, mentee, and optionally LPOC about new match
+    """
+    if not st.session_state.email_settings['use_email']:
+        return False, "Email notifications not configured"
 
+    try:
         # Send to mentor (with mentee CC'd)
-        msg_mentor = MIMEMultipart()
-        msg_mentor['From'] = sender_email
-        msg_mentor['To'] = mentor_email
-        msg_mentor['Cc'] = mentee_email
-        if lpoc_email:
-            msg_mentor['Cc'] = f"{mentee_email}, {lpoc_email}"
-        msg_mentor['Subject'] = subject
-        msg_mentor.attach(MIMEText(mentor_body, 'plain'))
-
-        recipients = [mentor_email, mentee_email]
-        if lpoc_email:
-            recipients.append(lpoc_email)
-
-        server.send_message(msg_mentor)
-
-        server.quit()
+        msg_mentor = _build_match_message(st.session_state.email_settings['sender_email'],
+                                          mentor_email, mentee_email, mentor_name,
+                                          mentee_name, project_name, match_score,
+                                          rationale, lpoc_email)
+
+        # Reuse the session's authenticated SMTP connection; if it went
+        # stale mid-send, reconnect once and retry
+        try:
+            _get_smtp().send_message(msg_mentor)
+        except (smtplib.SMTPException, OSError):
+            st.session_state.pop('_smtp_conn', None)
+            _get_smtp().send_message(msg_mentor)
+
         return True, "Email notifications sent successfully!"
 
     except Exception as e:
+        # Drop the cached connection so the next send starts clean
+        st.session_state.pop('_smtp_conn', None)
         return False, f"Email error: {str(e)}"
 
-# Matching Algorithm Functions (same as before)
-def calculate_tag_overlap(tags1: str, tags2: str) -> float:
-    """Calculate percentage overlap between two comma-separated tag strings"""
-    if pd.isna(tags1) or pd.isna(tags2) or not tags1 or not tags2:
-        return 0.0
+@st.cache_resource(show_spinner=False)
+def _get_email_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Background pool for fire-and-forget sends, one per server process
+
+    The click handler returns immediately and the result surfaces on a
+    later rerun. Behind cache_resource because a module-level executor
+    would be re-created on every script rerun, leaving stale instances
+    around until garbage collection.
+    """
+    return concurrent.futures.ThreadPoolExecutor(max_workers=4)
 
-    set1 = set([t.strip().lower() for t in str(tags1).split(',')])
-    set2 = set([t.strip().lower() for t in str(tags2).split(',')])
+def _send_async(settings: dict, msg) -> None:
+    """Send one prebuilt message from a pool thread
 
-    if not set1 or not set2:
-        return 0.0
+    Opens its own connection from the captured settings - pool threads
+    have no ScriptRunContext and must not touch session state.
+    """
+    conn = _open_smtp(settings)
+    try:
+        conn.send_message(msg)
+    finally:
+        try:
+            conn.quit()
+        except Exception:
+            pass
+
+# Transient SMTP rejections worth retrying with backoff during bulk sends
+_RETRYABLE_SMTP_CODES = (421, 450, 454, 554)
+
+def send_match_notifications_bulk(notifications: List[dict], concurrency: int = 4,
+                                  progress_callback=None) -> Tuple[List[int], List[str]]:
+    """Send many match notifications over a pool of persistent SMTP connections
+
+    Each of the `concurrency` workers opens and authenticates one
+    connection for its whole run and pulls jobs from a shared queue, so
+    the per-email cost is a single send_message round trip. Transient
+    rejections are retried with exponential backoff. Each entry in
+    `notifications` holds the keyword arguments of _build_match_message
+    (minus the sender). Returns the positions (into `notifications`) of
+    the sends that succeeded plus a list of errors, so callers can mark
+    exactly the delivered ones even when part of the batch failed.
+    """
+    _ensure_email_imports()
+    settings = st.session_state.email_settings
+    if not settings['use_email']:
+        return [], ["Email notifications not configured"]
+    if not notifications:
+        return [], []
+
+    tasks: queue.Queue = queue.Queue()
+    for position, notification in enumerate(notifications):
+        tasks.put((position, notification))
+
+    total = len(notifications)
+    lock = threading.Lock()
+    succeeded: List[int] = []
+    done = 0
+    errors: List[str] = []
+
+    def worker():
+        nonlocal done
+        try:
+            conn = _open_smtp(settings)
+        except Exception as e:
+            with lock:
+                errors.append(f"SMTP connection failed: {e}")
+            return
+
+        while True:
+            try:
+                position, notification = tasks.get_nowait()
+            except queue.Empty:
+                break
 
-    intersection = len(set1.intersection(set2))
-    union = len(set1.union(set2))
+            for attempt in range(3):
+                try:
+                    conn.send_message(_build_match_message(settings['sender_email'], **notification))
+                    with lock:
+                        succeeded.append(position)
+                    break
+                except smtplib.SMTPResponseException as e:
+                    if e.smtp_code in _RETRYABLE_SMTP_CODES and attempt < 2:
+                        time.sleep(2 ** attempt)
+                        continue
+                    with lock:
+                        errors.append(f"{notification['mentor_email']}: {e}")
+                    break
+                except Exception as e:
+                    with lock:
+                        errors.append(f"{notification['mentor_email']}: {e}")
+                    break
+
+            with lock:
+                done += 1
+
+        try:
+            conn.quit()
+        except Exception:
+            pass
+
+    workers = [threading.Thread(target=worker) for _ in range(min(concurrency, total))]
+    for w in workers:
+        w.start()
+
+    # Progress is reported from this (script) thread - Streamlit widgets
+    # cannot be driven from the workers, which have no ScriptRunContext
+    while any(w.is_alive() for w in workers):
+        if progress_callback:
+            progress_callback(done, total)
+        time.sleep(0.1)
+    for w in workers:
+        w.join()
+    if progress_callback:
+        progress_callback(total, total)
+
+    # Jobs left behind by workers that never got a connection
+    while not tasks.empty():
+        _, notification = tasks.get_nowait()
+        errors.append(f"{notification['mentor_email']}: not sent (no SMTP connection)")
+
+    succeeded.sort()
+    return succeeded, errors
 
-    return (intersection / union) * 100 if union > 0 else 0.0
+# Matching Algorithm Functions (same as before)
+# Comma separator that absorbs surrounding whitespace: one regex split
+# replaces the split-then-strip-per-token double pass
+_TAG_SPLIT = re.compile(r'\s*,\s*')
 
-def check_language_match(mentor_langs: str, mentee_langs: str) -> bool:
-    """Check if mentor and mentee share at least one common language"""
-    if pd.isna(mentor_langs) or pd.isna(mentee_langs):
-        return False
+def _tag_set(tags: str) -> frozenset:
+    """Tokenize one comma-separated tag string into a lowercase frozenset"""
+    if not isinstance(tags, str):
+        return frozenset()
+    return frozenset(t for t in _TAG_SPLIT.split(tags.strip().lower()) if t)
 
-    mentor_set = set([l.strip().lower() for l in str(mentor_langs).split(',')])
-    mentee_set = set([l.strip().lower() for l in str(mentee_langs).split(',')])
+def calculate_tag_overlap(tags1: str, tags2: str) -> float:
+    """Calculate percentage overlap between two comma-separated tag strings"""
+    return _jaccard(_tag_set(tags1), _tag_set(tags2))
 
-    return len(mentor_set.intersection(mentee_set)) > 0
+def check_language_match(mentor_langs: str, mentee_langs: str) -> bool:
+    """Check if mentor and mentee share at least one common language"""
+    return bool(_tag_set(mentor_langs) & _tag_set(mentee_langs))
 
 def check_format_compatibility(mentor_format: str, mentee_format: str) -> bool:
     """Check if meeting format preferences are compatible"""
-    if pd.isna(mentor_format) or pd.isna(mentee_format):
+    # None / pd.NA / float NaN (x != x) counts as compatible, without
+    # the pd.isna scalar-dispatch overhead
+    if mentor_format is None or mentor_format is pd.NA or mentor_format != mentor_format \
+            or mentee_format is None or mentee_format is pd.NA or mentee_format != mentee_format:
         return True
 
     mentor_fmt = str(mentor_format).strip().lower()
@@ -217,91 +451,521 @@ def check_format_compatibility(mentor_format: str, mentee_format: str) -> bool:
 
 def check_timezone_compatibility(mentor_tz: str, mentee_tz: str) -> bool:
     """Check if timezones allow for reasonable meeting times"""
-    if pd.isna(mentor_tz) or pd.isna(mentee_tz):
+    if mentor_tz is None or mentor_tz is pd.NA or mentor_tz != mentor_tz \
+            or mentee_tz is None or mentee_tz is pd.NA or mentee_tz != mentee_tz:
         return True
 
     return str(mentor_tz).strip().lower() == str(mentee_tz).strip().lower()
 
-def calculate_match_score(mentor_row: pd.Series, mentee_row: pd.Series) -> Tuple[float, str]:
-    """Calculate compatibility score (0-100) and rationale"""
-    score_components = {}
-    rationale_parts = []
+def calculate_match_score(mentor_row: pd.Series, mentee_row: pd.Series,
+                          include_rationale: bool = True) -> Tuple[float, str]:
+    """Calculate compatibility score (0-100) and rationale
 
+    Pass include_rationale=False when only the numeric score matters
+    (thresholding, ranking); the string formatting is skipped entirely
+    and an empty rationale comes back.
+    """
     sector_overlap = calculate_tag_overlap(mentor_row['Sectors'], mentee_row['Sector'])
     expertise_overlap = calculate_tag_overlap(mentor_row['Expertise'], mentee_row['Needs'])
+    function_overlap = calculate_tag_overlap(mentor_row['Functions'], mentee_row['Needs'])
+    has_language_match = check_language_match(mentor_row['Languages'], mentee_row['Languages'])
+    format_compatible = check_format_compatibility(mentor_row['Format'], mentee_row['Format'])
+    timezone_compatible = check_timezone_compatibility(mentor_row['TimeZone'], mentee_row['TimeZone'])
+    has_availability = not pd.isna(mentor_row['Availability']) and not pd.isna(mentee_row['Availability'])
 
-    sector_score = (sector_overlap * 0.4 + expertise_overlap * 0.6)
-    score_components['sector_expertise'] = sector_score * 0.30
+    total_score = ((sector_overlap * 0.4 + expertise_overlap * 0.6) * 0.30
+                   + (100 if has_language_match else 0) * 0.20
+                   + (100 if format_compatible else 30) * 0.15
+                   + (100 if timezone_compatible else 50) * 0.10
+                   + (100 if has_availability else 50) * 0.15
+                   + function_overlap * 0.10)
 
-    if sector_overlap > 50:
-        rationale_parts.append(f"Strong sector alignment ({sector_overlap:.0f}%)")
-    if expertise_overlap > 50:
-        rationale_parts.append(f"High expertise-needs match ({expertise_overlap:.0f}%)")
+    rationale = ''
+    if include_rationale:
+        rationale = _build_rationale(sector_overlap, expertise_overlap, has_language_match,
+                                     format_compatible, timezone_compatible, function_overlap)
 
-    has_language_match = check_language_match(mentor_row['Languages'], mentee_row['Languages'])
-    language_score = 100 if has_language_match else 0
-    score_components['language'] = language_score * 0.20
+    return round(total_score, 1), rationale
 
-    if has_language_match:
-        rationale_parts.append("Common language")
-    else:
-        rationale_parts.append("⚠️ No language overlap")
+# Numba is an optional accelerator: when available, the pairwise Jaccard
+# kernel is JIT-compiled over integer-encoded tag IDs; otherwise the pure
+# Python set-based path below is used.
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+def _tokenize_col(series: pd.Series) -> List[frozenset]:
+    """Tokenize a comma-separated tag column into one lowercase frozenset per row"""
+    values = series.fillna('').astype(str).str.strip().str.lower()
+    return [frozenset(t for t in _TAG_SPLIT.split(row) if t) for row in values]
+
+def _df_hash(df) -> int:
+    """Cheap content fingerprint of a DataFrame/Series, used as a cache key"""
+    return int(pd.util.hash_pandas_object(df, index=False).sum())
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.Series: lambda _: None})
+def _cached_tokens(df_hash: int, column: str, series: pd.Series) -> List[frozenset]:
+    """Tokenize a tag column, memoized on the owning table's content hash
+
+    The hash key carries the cache identity; the Series itself is
+    excluded from hashing so unchanged tables skip re-tokenization
+    on every rerun.
+    """
+    return _tokenize_col(series)
 
-    format_compatible = check_format_compatibility(mentor_row['Format'], mentee_row['Format'])
-    format_score = 100 if format_compatible else 30
-    score_components['format'] = format_score * 0.15
+def _encode_tag_sets(tag_sets: List[frozenset], vocab: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode token sets as a padded (n, max_tags) int32 ID matrix plus row lengths
+
+    IDs are sorted within each row so the JIT kernel can intersect
+    them with a two-pointer merge instead of set objects.
+    """
+    for tags in tag_sets:
+        for t in tags:
+            if t not in vocab:
+                vocab[t] = len(vocab)
+
+    width = max((len(tags) for tags in tag_sets), default=0)
+    ids = np.full((len(tag_sets), max(width, 1)), -1, dtype=np.int32)
+    lens = np.zeros(len(tag_sets), dtype=np.int32)
+    for row, tags in enumerate(tag_sets):
+        lens[row] = len(tags)
+        ids[row, :len(tags)] = sorted(vocab[t] for t in tags)
+    return ids, lens
+
+if _NUMBA_AVAILABLE:
+    @st.cache_resource(show_spinner=False)
+    def _get_jaccard_kernel():
+        """Build and warm the JIT-compiled pairwise Jaccard kernel
+
+        A Streamlit script re-executes top to bottom on every rerun, so
+        the compile and warmup must live behind st.cache_resource: they
+        run once per server process and the compiled kernel is shared
+        across reruns and sessions.
+        """
+        @njit
+        def _jaccard_kernel(a_ids, a_lens, b_ids, b_lens, mask):
+            out = np.zeros((a_ids.shape[0], b_ids.shape[0]))
+            for i in range(a_ids.shape[0]):
+                for j in range(b_ids.shape[0]):
+                    la, lb = a_lens[i], b_lens[j]
+                    if not mask[i, j] or la == 0 or lb == 0:
+                        continue
+                    inter = 0
+                    x = 0
+                    y = 0
+                    while x < la and y < lb:
+                        if a_ids[i, x] == b_ids[j, y]:
+                            inter += 1
+                            x += 1
+                            y += 1
+                        elif a_ids[i, x] < b_ids[j, y]:
+                            x += 1
+                        else:
+                            y += 1
+                    out[i, j] = 100.0 * inter / (la + lb - inter)
+            return out
 
-    if format_compatible:
-        rationale_parts.append("Format compatible")
+        # Warm up so the first matching run doesn't pay the compile cost
+        _jaccard_kernel(np.full((1, 1), -1, dtype=np.int32), np.zeros(1, dtype=np.int32),
+                        np.full((1, 1), -1, dtype=np.int32), np.zeros(1, dtype=np.int32),
+                        np.ones((1, 1), dtype=np.bool_))
+        return _jaccard_kernel
 
-    timezone_compatible = check_timezone_compatibility(mentor_row['TimeZone'], mentee_row['TimeZone'])
-    timezone_score = 100 if timezone_compatible else 50
-    score_components['timezone'] = timezone_score * 0.10
+def _common_language_matrix(row_sets: List[frozenset], col_sets: List[frozenset]) -> np.ndarray:
+    """(M, N) boolean matrix of pairs sharing at least one language
 
-    if timezone_compatible:
-        rationale_parts.append("Same timezone")
+    Each distinct language becomes one bit of a uint64 mask, so the
+    all-pairs check is a single broadcast `&` over two integer arrays.
+    """
+    vocab: Dict[str, int] = {}
+    for langs in row_sets:
+        for lang in langs:
+            vocab.setdefault(lang, len(vocab))
+    for langs in col_sets:
+        for lang in langs:
+            vocab.setdefault(lang, len(vocab))
+
+    if len(vocab) > 64:
+        # More distinct languages than bitmask bits - fall back to set ops
+        return np.array([[bool(a & b) for b in col_sets] for a in row_sets])
+
+    def to_masks(tag_sets: List[frozenset]) -> np.ndarray:
+        masks = np.zeros(len(tag_sets), dtype=np.uint64)
+        for i, langs in enumerate(tag_sets):
+            bits = 0
+            for lang in langs:
+                bits |= 1 << vocab[lang]
+            masks[i] = bits
+        return masks
+
+    row_masks = to_masks(row_sets)
+    col_masks = to_masks(col_sets)
+    return (row_masks[:, None] & col_masks[None, :]) != 0
+
+@functools.lru_cache(maxsize=4096)
+def _jaccard_cached(a: frozenset, b: frozenset) -> float:
+    """Jaccard overlap (0-100) of two token sets, memoized
+
+    Real pools cluster on a small number of shared tag combinations
+    (e.g. several mentors in 'FinTech, HealthTech'), so repeated pairs
+    come straight from the cache.
+    """
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    return 100.0 * intersection / (len(a) + len(b) - intersection)
 
-    availability_score = 100 if not pd.isna(mentor_row['Availability']) and not pd.isna(mentee_row['Availability']) else 50
-    score_components['availability'] = availability_score * 0.15
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    """Order-invariant front for _jaccard_cached (Jaccard is symmetric)"""
+    return _jaccard_cached(a, b) if hash(a) <= hash(b) else _jaccard_cached(b, a)
 
-    function_overlap = calculate_tag_overlap(mentor_row['Functions'], mentee_row['Needs'])
-    score_components['functions'] = function_overlap * 0.10
+def _jaccard_matrix(row_sets: List[frozenset], col_sets: List[frozenset],
+                    mask: np.ndarray = None) -> np.ndarray:
+    """All-pairs Jaccard overlap (0-100) between two lists of token sets
 
-    if function_overlap > 40:
-        rationale_parts.append(f"Functional fit ({function_overlap:.0f}%)")
+    Cells where `mask` is False are skipped and stay 0 - used by the
+    hard-constraint prefilter in find_best_matches.
+    """
+    if _NUMBA_AVAILABLE:
+        vocab = {}
+        a_ids, a_lens = _encode_tag_sets(row_sets, vocab)
+        b_ids, b_lens = _encode_tag_sets(col_sets, vocab)
+        if mask is None:
+            mask = np.ones((len(row_sets), len(col_sets)), dtype=np.bool_)
+        return _get_jaccard_kernel()(a_ids, a_lens, b_ids, b_lens, mask)
+    # Preallocate and fill in place (float64: scores must round exactly
+    # like the scalar path) rather than building nested lists first
+    out = np.zeros((len(row_sets), len(col_sets)))
+    if mask is None:
+        for i, a in enumerate(row_sets):
+            for j, b in enumerate(col_sets):
+                out[i, j] = _jaccard(a, b)
+    else:
+        for i, j in np.argwhere(mask):
+            out[i, j] = _jaccard(row_sets[i], col_sets[j])
+    return out
 
-    total_score = sum(score_components.values())
-    rationale = "; ".join(rationale_parts)
+@dataclass
+class _TokenizedPool:
+    """Column-store (SoA) view of one side's hot matching fields
 
-    return round(total_score, 1), rationale
+    One array per column instead of per-row Series access: tokenized tag
+    sets keyed by column name, normalized format/timezone strings, and
+    the boolean masks the score matrices are built from.
+    """
+    tags: Dict[str, List[frozenset]]
+    format_lc: np.ndarray
+    format_open: np.ndarray
+    tz_lc: np.ndarray
+    tz_missing: np.ndarray
+    has_avail: np.ndarray
+
+def _tokenize_pool(df: pd.DataFrame, tag_cols: Tuple[str, ...]) -> _TokenizedPool:
+    """Build the tokenized column-store view for one side of the pool"""
+    df_hash = _df_hash(df)
+    fmt = df['Format'].fillna('').astype(str).str.strip().str.lower()
+    return _TokenizedPool(
+        tags={col: _cached_tokens(df_hash, col, df[col]) for col in tag_cols},
+        format_lc=fmt.to_numpy(),
+        format_open=(df['Format'].isna().to_numpy() | fmt.str.contains('either').to_numpy()),
+        tz_lc=df['TimeZone'].fillna('').astype(str).str.strip().str.lower().to_numpy(),
+        tz_missing=df['TimeZone'].isna().to_numpy(),
+        has_avail=df['Availability'].notna().to_numpy(),
+    )
+
+def _factorize_pair(row_values: np.ndarray, col_values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Factorize two string arrays over one shared vocabulary
+
+    Returns the integer code arrays for each side, so all-pairs equality
+    is an int compare instead of string comparison per cell.
+    """
+    codes = pd.factorize(np.concatenate([row_values, col_values]))[0]
+    return codes[:len(row_values)], codes[len(row_values):]
 
-def find_best_matches(mentors_df: pd.DataFrame, mentees_df: pd.DataFrame, top_n: int = 3) -> pd.DataFrame:
-    """Find best mentor matches for all mentees"""
-    all_matches = []
+def _top_n_indices(scores: np.ndarray, n: int) -> np.ndarray:
+    """Indices of the top-n scores, highest first
 
-    for _, mentee in mentees_df.iterrows():
-        mentee_matches = []
+    np.argpartition gives O(M) selection; only the n survivors are
+    sorted, stably, so equal scores keep their original row order.
+    """
+    if n < len(scores):
+        candidates = np.argpartition(-scores, n)[:n]
+        candidates.sort()
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+def _build_rationale(sector_pct: float, expertise_pct: float, has_language: bool,
+                     format_ok: bool, timezone_ok: bool, function_pct: float) -> str:
+    """Assemble the human-readable rationale for one surviving match
+
+    Only called for the top-N pairs per mentee; the ~97% of pairs that
+    get discarded never pay for string formatting.
+    """
+    parts = []
+    if sector_pct > 50:
+        parts.append(f"Strong sector alignment ({sector_pct:.0f}%)")
+    if expertise_pct > 50:
+        parts.append(f"High expertise-needs match ({expertise_pct:.0f}%)")
+    if has_language:
+        parts.append("Common language")
+    else:
+        parts.append("⚠️ No language overlap")
+    if format_ok:
+        parts.append("Format compatible")
+    if timezone_ok:
+        parts.append("Same timezone")
+    if function_pct > 40:
+        parts.append(f"Functional fit ({function_pct:.0f}%)")
+    return "; ".join(parts)
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: lambda _: None})
+def _score_matrices(mentors_hash: int, mentees_hash: int, min_score: float,
+                    mentors_df: pd.DataFrame, mentees_df: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+    """All (M, N) score and component matrices, cached on table content
+
+    Kept separate from the top-N selection so changing `top_n` between
+    runs reuses the matrices instead of rescoring every pair.
+    """
+    # Tokenize each side once into a column-store view - O(M+N) string
+    # work instead of O(M*N), cached across reruns while unchanged
+    mentors = _tokenize_pool(mentors_df, ('Sectors', 'Expertise', 'Functions', 'Languages'))
+    mentees = _tokenize_pool(mentees_df, ('Sector', 'Needs', 'Languages'))
+
+    lang_match = _common_language_matrix(mentors.tags['Languages'], mentees.tags['Languages'])
+
+    # A missing value (or an 'either' format) on either side counts as
+    # compatible, like the scalar helpers; equality runs on factorized
+    # integer codes rather than broadcast string compares
+    mentor_fmt_codes, mentee_fmt_codes = _factorize_pair(mentors.format_lc, mentees.format_lc)
+    fmt_compat = (mentors.format_open[:, None] | mentees.format_open[None, :]
+                  | (mentor_fmt_codes[:, None] == mentee_fmt_codes[None, :]))
+    mentor_tz_codes, mentee_tz_codes = _factorize_pair(mentors.tz_lc, mentees.tz_lc)
+    tz_compat = (mentors.tz_missing[:, None] | mentees.tz_missing[None, :]
+                 | (mentor_tz_codes[:, None] == mentee_tz_codes[None, :]))
+
+    avail_score = np.where(mentors.has_avail[:, None] & mentees.has_avail[None, :], 100, 50)
+
+    # Cheap hard-constraint terms first; the sector/expertise and function
+    # terms can add at most 40 points on top, so pairs that cannot reach
+    # min_score even then never pay for the Jaccard overlaps
+    fixed_terms = (np.where(lang_match, 100, 0) * 0.20
+                   + np.where(fmt_compat, 100, 30) * 0.15
+                   + np.where(tz_compat, 100, 50) * 0.10
+                   + avail_score * 0.15)
+    # 0.05 margin: reported scores are rounded to one decimal, so a pair
+    # just under the threshold can still round up into it
+    viable = fixed_terms + 40.0 >= min_score - 0.05
+    prefilter = None if viable.all() else viable
+
+    sector_overlap = _jaccard_matrix(mentors.tags['Sectors'], mentees.tags['Sector'], prefilter)
+    expertise_overlap = _jaccard_matrix(mentors.tags['Expertise'], mentees.tags['Needs'], prefilter)
+    function_overlap = _jaccard_matrix(mentors.tags['Functions'], mentees.tags['Needs'], prefilter)
+
+    # Weighted sum, same components and weights as calculate_match_score
+    sector_score = sector_overlap * 0.4 + expertise_overlap * 0.6
+    total = fixed_terms + sector_score * 0.30 + function_overlap * 0.10
+
+    return (total, sector_overlap, expertise_overlap, function_overlap,
+            lang_match, fmt_compat, tz_compat)
+
+# Columns of the frame find_best_matches produces; empty results carry
+# them too so callers can filter on Score without guarding
+_MATCH_RESULT_COLS = ('MenteeID', 'MenteeName', 'MenteeEmail', 'ProjectName', 'LPOC',
+                      'MentorID', 'MentorName', 'MentorEmail', 'Score', 'Rationale')
+
+def find_best_matches(mentors_df: pd.DataFrame, mentees_df: pd.DataFrame, top_n: int = 3,
+                      min_score: float = 0.0) -> pd.DataFrame:
+    """Find best mentor matches for all mentees
+
+    Scores every mentor x mentee pair in one vectorized pass: each tag column
+    is tokenized once per side and the pairwise overlaps become (M, N) NumPy
+    matrices, instead of re-splitting the same strings inside a Python
+    double loop. Rationale strings are only built for the top-N survivors.
+
+    `min_score` is a prefilter hint: pairs whose cheap compatibility terms
+    plus the maximum possible tag contribution still fall short of it skip
+    the tag-overlap work, since the caller drops them anyway.
+    """
+    if len(mentors_df) == 0 or len(mentees_df) == 0:
+        return pd.DataFrame(columns=_MATCH_RESULT_COLS)
+
+    (total, sector_overlap, expertise_overlap, function_overlap,
+     lang_match, fmt_compat, tz_compat) = _score_matrices(
+        _df_hash(mentors_df), _df_hash(mentees_df), min_score, mentors_df, mentees_df)
+
+    # Mentees where even the best pair stays under the threshold produce
+    # no rows the caller would keep - skip their selection entirely
+    best_per_mentee = total.max(axis=0)
+
+    # Collect the surviving (mentor, mentee) index pairs, then build the
+    # result frame column-wise with NumPy gathers - no dict per row
+    mentor_idx: List[int] = []
+    mentee_idx: List[int] = []
+
+    for j in range(len(mentees_df)):
+        if best_per_mentee[j] < min_score - 0.05:
+            continue
+        top_mentors = _top_n_indices(total[:, j], top_n)
+        mentor_idx.extend(top_mentors)
+        mentee_idx.extend([j] * len(top_mentors))
+
+    if not mentor_idx:
+        return pd.DataFrame(columns=_MATCH_RESULT_COLS)
+
+    mentor_rows = np.array(mentor_idx)
+    mentee_cols = np.array(mentee_idx)
+
+    rationales = [_build_rationale(sector_overlap[i, j], expertise_overlap[i, j],
+                                   lang_match[i, j], fmt_compat[i, j],
+                                   tz_compat[i, j], function_overlap[i, j])
+                  for i, j in zip(mentor_rows, mentee_cols)]
+
+    return pd.DataFrame({
+        'MenteeID': mentees_df['MenteeID'].to_numpy()[mentee_cols],
+        'MenteeName': mentees_df['Name'].to_numpy()[mentee_cols],
+        'MenteeEmail': mentees_df['Email'].to_numpy()[mentee_cols],
+        'ProjectName': mentees_df['ProjectName'].to_numpy()[mentee_cols],
+        'LPOC': mentees_df['LPOC'].to_numpy()[mentee_cols],
+        'MentorID': mentors_df['MentorID'].to_numpy()[mentor_rows],
+        'MentorName': mentors_df['Name'].to_numpy()[mentor_rows],
+        'MentorEmail': mentors_df['Email'].to_numpy()[mentor_rows],
+        'Score': np.round(total[mentor_rows, mentee_cols], 1),
+        'Rationale': rationales,
+    })
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: lambda _: None})
+def _cached_best_matches(mentors_hash: int, mentees_hash: int, top_n: int, min_score: float,
+                         mentors_df: pd.DataFrame, mentees_df: pd.DataFrame) -> pd.DataFrame:
+    """Memoized find_best_matches; repeat runs on unchanged tables are free"""
+    return find_best_matches(mentors_df, mentees_df, top_n=top_n, min_score=min_score)
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: lambda _: None})
+def _csv_bytes(df_hash: int, df: pd.DataFrame) -> bytes:
+    """CSV bytes for a download button, re-serialized only when data changes
+
+    Written straight into a BytesIO so the payload is materialized once
+    as bytes instead of building a str and re-encoding it.
+    """
+    from io import BytesIO
+
+    buf = BytesIO()
+    df.to_csv(buf, index=False)
+    return buf.getvalue()
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: lambda _: None})
+def _excel_bytes(mentors_hash: int, mentees_hash: int, matches_hash: int,
+                 mentors_df: pd.DataFrame, mentees_df: pd.DataFrame,
+                 matches_df: pd.DataFrame) -> bytes:
+    """Three-sheet export workbook, rebuilt only when a table changes
+
+    The openpyxl/xlsxwriter zip build is by far the most expensive
+    serialization on the Export page, so it is cached like the CSVs.
+    """
+    from io import BytesIO
 
-        for _, mentor in mentors_df.iterrows():
-            score, rationale = calculate_match_score(mentor, mentee)
+    output = BytesIO()
+    try:
+        # strings_to_urls is off: it costs a regex scan per string cell
+        # and the openpyxl engine never hyperlinked exports either.
+        # constant_memory must stay off - pandas emits body cells
+        # column-major, and constant_memory flushes each row on first
+        # touch of a later one, silently discarding every other column.
+        writer = pd.ExcelWriter(output, engine='xlsxwriter',
+                                engine_kwargs={'options': {'strings_to_urls': False}})
+    except ImportError:
+        writer = pd.ExcelWriter(output, engine='openpyxl')
+    with writer:
+        mentors_df.to_excel(writer, sheet_name='Mentors', index=False)
+        mentees_df.to_excel(writer, sheet_name='Mentees', index=False)
+        matches_df.to_excel(writer, sheet_name='Matches', index=False)
+    return output.getvalue()
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.Series: lambda _: None})
+def _top_mentor_sectors(df_hash: int, sectors: pd.Series) -> pd.Series:
+    """Top-5 sector counts for the Dashboard, memoized on content hash
+
+    Counts via an unbuffered np.add.at scatter-add over factorized
+    sector IDs; also ready to take per-mentor weights if sector counts
+    ever need weighting (e.g. by MaxMentees).
+    """
+    # One strip per row plus a whitespace-absorbing separator, instead
+    # of a second per-token strip pass after the split
+    tokens = (sectors.dropna().astype(str).str.strip()
+              .str.split(_TAG_SPLIT).explode())
+    if tokens.empty:
+        return pd.Series(dtype='int64')
+    ids, unique_sectors = pd.factorize(tokens.to_numpy())
+    counts = np.zeros(len(unique_sectors), dtype=np.int64)
+    np.add.at(counts, ids, 1)
+    if len(counts) > 5:
+        top = np.argpartition(-counts, 5)[:5]
+    else:
+        top = np.arange(len(counts))
+    top = top[np.argsort(-counts[top], kind='stable')]
+    return pd.Series(counts[top], index=unique_sectors[top])
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.Series: lambda _: None})
+def _stage_counts(df_hash: int, stages: pd.Series) -> pd.Series:
+    """Project-stage counts for the Dashboard, memoized on content hash"""
+    return stages.value_counts()
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: lambda _: None})
+def _compact_matches(df_hash: int, matches: pd.DataFrame) -> pd.DataFrame:
+    """Dtype-shrunk view of the matches table for filtering and rendering
+
+    Status/EmailSent become Categoricals (so .isin compares int codes)
+    and PriorityScore float32. Built as a cached view because the
+    append path keeps the stored table's flexible dtypes - enlarging a
+    categorical column through .loc would upcast it right back.
+    """
+    compact = matches.copy()
+    for col in ('Status', 'EmailSent'):
+        compact[col] = compact[col].astype('category')
+    compact['PriorityScore'] = compact['PriorityScore'].astype('float32')
+    return compact
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: lambda _: None})
+def _status_mask(df_hash: int, statuses: Tuple[str, ...], matches: pd.DataFrame) -> np.ndarray:
+    """Boolean mask of matches whose Status is in `statuses`
+
+    Keyed on the table hash plus the (sorted) filter tuple, so toggling
+    unrelated widgets doesn't rerun the isin scan.
+    """
+    return matches['Status'].isin(statuses).to_numpy()
 
-            mentee_matches.append({
-                'MenteeID': mentee['MenteeID'],
-                'MenteeName': mentee['Name'],
-                'MenteeEmail': mentee['Email'],
-                'ProjectName': mentee['ProjectName'],
-                'LPOC': mentee['LPOC'],
-                'MentorID': mentor['MentorID'],
-                'MentorName': mentor['Name'],
-                'MentorEmail': mentor['Email'],
-                'Score': score,
-                'Rationale': rationale
-            })
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: lambda _: None})
+def _match_display_df(df_hash: int, statuses: Tuple[str, ...],
+                      filtered: pd.DataFrame) -> pd.DataFrame:
+    """Plain display frame for the matches overview
 
-        mentee_matches.sort(key=lambda x: x['Score'], reverse=True)
-        all_matches.extend(mentee_matches[:top_n])
+    Score pre-formatted, badge column precomputed, rendered through the
+    native st.dataframe path (no Styler). Cached on the table hash plus
+    the filter tuple so rerun cost is one cache lookup.
+    """
+    email_badges = np.where(filtered['EmailSent'].to_numpy() == 'Yes', '📧✅', '📧❌')
+    return (filtered[['MatchID', 'MenteeID', 'MentorID', 'Status']]
+            .assign(Score=filtered['PriorityScore'].map('{:.1f}'.format).astype(str),
+                    Email=email_badges)
+            [['MatchID', 'MenteeID', 'MentorID', 'Score', 'Status', 'Email']])
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: lambda _: None})
+def _indexed_by(df_hash: int, id_col: str, df: pd.DataFrame) -> pd.DataFrame:
+    """ID-indexed view of a table for O(1) row lookups
+
+    Rebuilt automatically when the content hash changes, so mutations
+    invalidate it without explicit bookkeeping.
+    """
+    return df.set_index(id_col, drop=False)
 
-    return pd.DataFrame(all_matches)
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: lambda _: None})
+def _match_stats(df_hash: int, matches: pd.DataFrame) -> Tuple[int, float]:
+    """Active-match count and mean score for the Dashboard metrics"""
+    active = int((matches['Status'] == 'Active').sum())
+    avg_score = matches['PriorityScore'].mean()
+    return active, avg_score
 
 # Application Header
 st.title("🤝 RUN-InnoBoost Mentor Matching System")
@@ -329,29 +993,29 @@ if page == "🏠 Dashboard":
         st.metric("Total Mentors", len(st.session_state.mentors))
     with col2:
         st.metric("Total Mentees", len(st.session_state.mentees))
+    if len(st.session_state.matches) > 0:
+        active_count, avg_score = _match_stats(_df_hash(st.session_state.matches),
+                                               st.session_state.matches)
+    else:
+        active_count, avg_score = 0, 0
     with col3:
-        st.metric("Active Matches", 
-                 len(st.session_state.matches[st.session_state.matches['Status'] == 'Active']) 
-                 if len(st.session_state.matches) > 0 else 0)
+        st.metric("Active Matches", active_count)
     with col4:
-        avg_score = st.session_state.matches['PriorityScore'].mean() if len(st.session_state.matches) > 0 else 0
         st.metric("Avg Match Score", f"{avg_score:.1f}")
 
     st.subheader("Quick Stats")
 
     if len(st.session_state.mentors) > 0:
         st.write("**Top Mentor Sectors:**")
-        all_sectors = []
-        for sectors in st.session_state.mentors['Sectors'].dropna():
-            all_sectors.extend([s.strip() for s in str(sectors).split(',')])
-        if all_sectors:
-            sector_counts = pd.Series(all_sectors).value_counts().head(5)
+        sectors = st.session_state.mentors['Sectors']
+        sector_counts = _top_mentor_sectors(_df_hash(sectors), sectors)
+        if len(sector_counts) > 0:
             st.bar_chart(sector_counts)
 
     if len(st.session_state.mentees) > 0:
         st.write("**Mentee Project Stages:**")
-        stage_counts = st.session_state.mentees['Stage'].value_counts()
-        st.bar_chart(stage_counts)
+        stages = st.session_state.mentees['Stage']
+        st.bar_chart(_stage_counts(_df_hash(stages), stages))
 
 # ==================== MANAGE MENTORS PAGE ====================
 elif page == "👨‍🏫 Manage Mentors":
@@ -399,7 +1063,7 @@ elif page == "👨‍🏫 Manage Mentors":
 
             if submitted:
                 if name and email and languages:
-                    new_mentor = pd.DataFrame([{
+                    new_mentor = {
                         'MentorID': mentor_id,
                         'Name': name,
                         'Email': email,
@@ -420,10 +1084,9 @@ elif page == "👨‍🏫 Manage Mentors":
                         'LinkedIn': linkedin,
                         'Conflicts': conflicts,
                         'Notes': notes
-                    }])
+                    }
 
-                    st.session_state.mentors = pd.concat([st.session_state.mentors, new_mentor], 
-                                                         ignore_index=True)
+                    _append_row(st.session_state.mentors, new_mentor)
                     st.success(f"✅ Mentor {name} added successfully!")
                     st.rerun()
                 else:
@@ -456,7 +1119,7 @@ elif page == "👨‍🏫 Manage Mentors":
         uploaded_file = st.file_uploader("Choose CSV file", type=['csv'])
         if uploaded_file:
             try:
-                df = pd.read_csv(uploaded_file)
+                df = _read_import_csv(uploaded_file)
                 st.write("Preview:")
                 st.dataframe(df.head())
 
@@ -517,7 +1180,7 @@ elif page == "👨‍🎓 Manage Mentees":
 
             if submitted:
                 if name and email and project_name and sector and needs and languages:
-                    new_mentee = pd.DataFrame([{
+                    new_mentee = {
                         'MenteeID': mentee_id,
                         'Name': name,
                         'Email': email,
@@ -540,10 +1203,9 @@ elif page == "👨‍🎓 Manage Mentees":
                         'Gender': gender,
                         'Consent': consent,
                         'Notes': notes
-                    }])
+                    }
 
-                    st.session_state.mentees = pd.concat([st.session_state.mentees, new_mentee], 
-                                                         ignore_index=True)
+                    _append_row(st.session_state.mentees, new_mentee)
                     st.success(f"✅ Mentee {name} added successfully!")
                     st.rerun()
                 else:
@@ -574,7 +1236,7 @@ elif page == "👨‍🎓 Manage Mentees":
         uploaded_file = st.file_uploader("Choose CSV file", type=['csv'], key="mentee_upload")
         if uploaded_file:
             try:
-                df = pd.read_csv(uploaded_file)
+                df = _read_import_csv(uploaded_file)
                 st.write("Preview:")
                 st.dataframe(df.head())
 
@@ -607,9 +1269,11 @@ elif page == "🎯 Smart Matching":
 
         if st.button("🚀 Run Matching Algorithm", type="primary"):
             with st.spinner("Calculating optimal matches..."):
-                matches_df = find_best_matches(st.session_state.mentors, 
-                                               st.session_state.mentees, 
-                                               top_n=top_n)
+                matches_df = _cached_best_matches(_df_hash(st.session_state.mentors),
+                                                  _df_hash(st.session_state.mentees),
+                                                  top_n, min_score,
+                                                  st.session_state.mentors,
+                                                  st.session_state.mentees)
 
                 matches_df = matches_df[matches_df['Score'] >= min_score]
 
@@ -627,31 +1291,31 @@ elif page == "🎯 Smart Matching":
                     with st.expander(f"🎓 {mentee_name} ({mentee_id}) - {len(mentee_matches)} matches", 
                                     expanded=True):
 
-                        for idx, match in mentee_matches.iterrows():
+                        for match in mentee_matches.itertuples(index=False):
                             col1, col2, col3 = st.columns([3, 1, 2])
 
                             with col1:
-                                st.markdown(f"**👨‍🏫 {match['MentorName']}** ({match['MentorID']})")
-                                st.caption(match['Rationale'])
+                                st.markdown(f"**👨‍🏫 {match.MentorName}** ({match.MentorID})")
+                                st.caption(match.Rationale)
 
                             with col2:
-                                score_color = "🟢" if match['Score'] >= 70 else "🟡" if match['Score'] >= 50 else "🟠"
-                                st.metric("Match Score", f"{match['Score']:.1f}", 
+                                score_color = "🟢" if match.Score >= 70 else "🟡" if match.Score >= 50 else "🟠"
+                                st.metric("Match Score", f"{match.Score:.1f}",
                                          delta=None, label_visibility="collapsed")
                                 st.caption(f"{score_color}")
 
                             with col3:
-                                if st.button(f"✅ Approve & Notify", 
-                                           key=f"approve_{match['MenteeID']}_{match['MentorID']}"):
+                                if st.button(f"✅ Approve & Notify",
+                                           key=f"approve_{match.MenteeID}_{match.MentorID}"):
 
                                     # Create match record
-                                    new_match = pd.DataFrame([{
+                                    new_match = {
                                         'MatchID': f"MA{len(st.session_state.matches)+1:03d}",
-                                        'MenteeID': match['MenteeID'],
-                                        'MentorID': match['MentorID'],
+                                        'MenteeID': match.MenteeID,
+                                        'MentorID': match.MentorID,
                                         'Status': 'Proposed',
-                                        'PriorityScore': match['Score'],
-                                        'Rationale': match['Rationale'],
+                                        'PriorityScore': match.Score,
+                                        'Rationale': match.Rationale,
                                         'StartDate': '',
                                         'Session1': '',
                                         'Session2': '',
@@ -661,43 +1325,86 @@ elif page == "🎯 Smart Matching":
                                         'Outcome': '',
                                         'ConvertedToMentor': '',
                                         'ClosedDate': '',
-                                        'LPOC': match['LPOC'],
+                                        'LPOC': match.LPOC,
                                         'EmailSent': 'No'
-                                    }])
+                                    }
 
-                                    st.session_state.matches = pd.concat(
-                                        [st.session_state.matches, new_match], 
-                                        ignore_index=True
-                                    )
+                                    _append_row(st.session_state.matches, new_match)
+                                    new_match_idx = st.session_state.matches.index[-1]
 
                                     # Send email if enabled
                                     if send_emails and st.session_state.email_settings['use_email']:
                                         success, message = send_match_notification_email(
-                                            mentor_email=match['MentorEmail'],
-                                            mentee_email=match['MenteeEmail'],
-                                            mentor_name=match['MentorName'],
-                                            mentee_name=match['MenteeName'],
-                                            project_name=match['ProjectName'],
-                                            match_score=match['Score'],
-                                            rationale=match['Rationale'],
+                                            mentor_email=match.MentorEmail,
+                                            mentee_email=match.MenteeEmail,
+                                            mentor_name=match.MentorName,
+                                            mentee_name=match.MenteeName,
+                                            project_name=match.ProjectName,
+                                            match_score=match.Score,
+                                            rationale=match.Rationale,
                                             lpoc_email=None  # Add LPOC email if available
                                         )
 
                                         if success:
-                                            st.session_state.matches.loc[
-                                                st.session_state.matches['MatchID'] == new_match['MatchID'].iloc[0],
-                                                'EmailSent'
-                                            ] = 'Yes'
-                                            st.success(f"✅ Match created and emails sent to {match['MenteeName']} ↔ {match['MentorName']}")
+                                            # The row was just appended; no need to scan for it
+                                            st.session_state.matches.at[new_match_idx, 'EmailSent'] = 'Yes'
+                                            st.success(f"✅ Match created and emails sent to {match.MenteeName} ↔ {match.MentorName}")
                                         else:
                                             st.warning(f"✅ Match created but email failed: {message}")
                                     else:
-                                        st.success(f"✅ Match created: {match['MenteeName']} ↔ {match['MentorName']}")
+                                        st.success(f"✅ Match created: {match.MenteeName} ↔ {match.MentorName}")
 
                                     st.rerun()
 
                             st.divider()
 
+        # Bulk notification path: fan pending emails out over a small
+        # worker pool instead of one connection round trip per match
+        if len(st.session_state.matches) > 0:
+            pending = st.session_state.matches[st.session_state.matches['EmailSent'] != 'Yes']
+            if len(pending) > 0 and st.session_state.email_settings['use_email']:
+                if st.button(f"📧 Send {len(pending)} pending match notification(s)"):
+                    notifications = []
+                    notified_idx = []
+                    for m in pending.itertuples(index=True):
+                        mentor = st.session_state.mentors[
+                            st.session_state.mentors['MentorID'] == m.MentorID]
+                        mentee = st.session_state.mentees[
+                            st.session_state.mentees['MenteeID'] == m.MenteeID]
+                        if len(mentor) == 0 or len(mentee) == 0:
+                            continue
+                        mentor, mentee = mentor.iloc[0], mentee.iloc[0]
+                        notified_idx.append(m.Index)
+                        notifications.append({
+                            'mentor_email': mentor['Email'],
+                            'mentee_email': mentee['Email'],
+                            'mentor_name': mentor['Name'],
+                            'mentee_name': mentee['Name'],
+                            'project_name': mentee['ProjectName'],
+                            'match_score': m.PriorityScore,
+                            'rationale': m.Rationale,
+                        })
+
+                    progress = st.progress(0.0)
+                    sent_positions, errors = send_match_notifications_bulk(
+                        notifications,
+                        progress_callback=lambda done, total: progress.progress(done / total))
+
+                    # Mark exactly the rows whose email went out, even when
+                    # other sends in the batch failed - failed and skipped
+                    # matches stay pending for the next attempt
+                    if sent_positions:
+                        st.session_state.matches.loc[
+                            [notified_idx[pos] for pos in sent_positions], 'EmailSent'] = 'Yes'
+
+                    if errors:
+                        st.warning(f"Sent {len(sent_positions)} notification(s); "
+                                   f"{len(errors)} failed: " + "; ".join(errors[:3]))
+                    elif sent_positions:
+                        st.success(f"✅ Sent {len(sent_positions)} match notification(s)")
+                    else:
+                        st.warning("No pending match had a matching mentor and mentee on file")
+
 # ==================== MATCH MANAGEMENT PAGE ====================
 elif page == "📊 Match Management":
     st.header("Match Management & Tracking")
@@ -707,78 +1414,126 @@ elif page == "📊 Match Management":
     else:
         col1, col2, col3 = st.columns(3)
         with col1:
-            status_filter = st.multiselect("Filter by Status", 
-                                          ["Proposed", "Confirmed", "Active", "Completed", "Declined"],
-                                          default=["Proposed", "Confirmed", "Active"])
+            status_filter = st.multiselect("Filter by Status",
+                                          STATUSES,
+                                          default=STATUSES[:3])
+
+        # Surface results of background resends queued on earlier reruns
+        pending_futures = []
+        for match_id, future in st.session_state.get('email_futures', []):
+            if future.done():
+                error = future.exception()
+                if error:
+                    st.error(f"❌ Resend for {match_id} failed: {error}")
+                else:
+                    st.success(f"✅ Resend for {match_id} sent")
+            else:
+                pending_futures.append((match_id, future))
+        st.session_state.email_futures = pending_futures
 
-        filtered_matches = st.session_state.matches[
-            st.session_state.matches['Status'].isin(status_filter)
-        ] if status_filter else st.session_state.matches
+        matches_hash = _df_hash(st.session_state.matches)
+        matches_view = _compact_matches(matches_hash, st.session_state.matches)
+        filtered_matches = matches_view[
+            _status_mask(matches_hash, tuple(sorted(status_filter)), matches_view)
+        ] if status_filter else matches_view
 
         st.subheader(f"All Matches ({len(filtered_matches)})")
 
-        for idx, match in filtered_matches.iterrows():
-            email_badge = "📧✅" if match.get('EmailSent') == 'Yes' else "📧❌"
-
-            with st.expander(f"Match {match['MatchID']} - Score: {match['PriorityScore']:.1f} - Status: {match['Status']} {email_badge}"):
+        # Overview through the native table renderer (fast at any size),
+        # then one editor for the selected match - per-rerun widget count
+        # is constant instead of a dozen widgets per row. This replaces
+        # the earlier paginated expander list.
+        display_df = _match_display_df(matches_hash, tuple(sorted(status_filter)),
+                                       filtered_matches)
+        st.dataframe(display_df, hide_index=True, use_container_width=True)
+        email_badges = display_df['Email'].to_numpy()
+
+        if len(filtered_matches) > 0:
+            selected_id = st.selectbox("Open match", filtered_matches['MatchID'].tolist(),
+                                       key="open_match")
+            selected_pos = int(np.flatnonzero(
+                filtered_matches['MatchID'].to_numpy() == selected_id)[0])
+            match = next(filtered_matches.iloc[[selected_pos]]
+                         .itertuples(index=True, name='Match'))
+            idx = match.Index
+            email_badge = email_badges[selected_pos]
+
+            with st.expander(f"Match {match.MatchID} - Score: {match.PriorityScore:.1f}"
+                             f" - Status: {match.Status} {email_badge}", expanded=True):
                 col1, col2 = st.columns(2)
 
                 with col1:
                     st.markdown("**Match Details:**")
-                    st.write(f"Mentee ID: {match['MenteeID']}")
-                    st.write(f"Mentor ID: {match['MentorID']}")
-                    st.write(f"Priority Score: {match['PriorityScore']:.1f}")
-                    st.write(f"Rationale: {match['Rationale']}")
-                    st.write(f"Email Sent: {match.get('EmailSent', 'No')}")
+                    st.write(f"Mentee ID: {match.MenteeID}")
+                    st.write(f"Mentor ID: {match.MentorID}")
+                    st.write(f"Priority Score: {match.PriorityScore:.1f}")
+                    st.write(f"Rationale: {match.Rationale}")
+                    st.write(f"Email Sent: {getattr(match, 'EmailSent', 'No')}")
 
                 with col2:
-                    new_status = st.selectbox("Update Status", 
-                                            ["Proposed", "Confirmed", "Active", "Completed", "Declined"],
-                                            index=["Proposed", "Confirmed", "Active", "Completed", "Declined"].index(match['Status']),
-                                            key=f"status_{idx}")
-
-                    start_date = st.date_input("Start Date", key=f"start_{idx}")
-                    session1_date = st.date_input("Session 1 Date", key=f"s1_{idx}")
-
-                    if new_status in ["Completed"]:
+                    # One form per match: editing fields no longer reruns
+                    # the script per keystroke/selection, only on submit
+                    with st.form(f"edit_{idx}"):
+                        new_status = st.selectbox("Update Status",
+                                                STATUSES,
+                                                index=STATUS_INDEX[match.Status],
+                                                key=f"status_{idx}")
+
+                        start_date = st.date_input("Start Date", key=f"start_{idx}")
+                        session1_date = st.date_input("Session 1 Date", key=f"s1_{idx}")
+
+                        # Always rendered (a form cannot reveal fields on
+                        # selectbox change); only saved for Completed
                         mentee_sat = st.slider("Mentee Satisfaction", 1, 5, 3, key=f"msat_{idx}")
                         mentor_sat = st.slider("Mentor Satisfaction", 1, 5, 3, key=f"mrsat_{idx}")
-                        outcome = st.text_area("Outcome", key=f"outcome_{idx}")
+                        outcome = st.text_area("Outcome (saved when Completed)", key=f"outcome_{idx}")
+
+                        submitted = st.form_submit_button("💾 Update Match")
+
+                    if submitted:
+                        updates = {'Status': new_status,
+                                   'StartDate': str(start_date),
+                                   'Session1': str(session1_date)}
+                        if new_status == "Completed":
+                            # The satisfaction/outcome widgets ride along
+                            # in the same batched writeback
+                            updates.update({'MenteeSatisfaction': mentee_sat,
+                                            'MentorSatisfaction': mentor_sat,
+                                            'Outcome': outcome})
+                        st.session_state.matches.loc[idx, list(updates)] = list(updates.values())
+                        st.success("Match updated!")
+                        st.rerun()
 
                     # Resend email button
                     if st.button("📧 Resend Match Email", key=f"resend_{idx}"):
                         if st.session_state.email_settings['use_email']:
-                            # Get mentor and mentee details
-                            mentor = st.session_state.mentors[
-                                st.session_state.mentors['MentorID'] == match['MentorID']
-                            ].iloc[0]
-                            mentee = st.session_state.mentees[
-                                st.session_state.mentees['MenteeID'] == match['MenteeID']
-                            ].iloc[0]
-
-                            success, message = send_match_notification_email(
-                                mentor_email=mentor['Email'],
-                                mentee_email=mentee['Email'],
-                                mentor_name=mentor['Name'],
-                                mentee_name=mentee['Name'],
-                                project_name=mentee['ProjectName'],
-                                match_score=match['PriorityScore'],
-                                rationale=match['Rationale']
-                            )
-
-                            if success:
-                                st.success("✅ Email resent successfully!")
-                            else:
-                                st.error(f"❌ {message}")
+                            # O(1) hash lookups on the ID-indexed views
+                            # instead of boolean scans over both tables
+                            mentor = _indexed_by(_df_hash(st.session_state.mentors),
+                                                 'MentorID', st.session_state.mentors).loc[match.MentorID]
+                            mentee = _indexed_by(_df_hash(st.session_state.mentees),
+                                                 'MenteeID', st.session_state.mentees).loc[match.MenteeID]
+                            if isinstance(mentor, pd.DataFrame):
+                                mentor = mentor.iloc[0]
+                            if isinstance(mentee, pd.DataFrame):
+                                mentee = mentee.iloc[0]
+
+                            # Compose here, send on the background pool:
+                            # the click returns without blocking on SMTP
+                            msg = _build_match_message(
+                                st.session_state.email_settings['sender_email'],
+                                mentor['Email'], mentee['Email'],
+                                mentor['Name'], mentee['Name'],
+                                mentee['ProjectName'], match.PriorityScore,
+                                match.Rationale)
+                            future = _get_email_pool().submit(
+                                _send_async, dict(st.session_state.email_settings), msg)
+                            st.session_state.setdefault('email_futures', []).append(
+                                (match.MatchID, future))
+                            st.toast("📧 Resend queued")
                         else:
                             st.warning("⚠️ Email settings not configured. Go to Email Settings page.")
 
-                    if st.button("💾 Update Match", key=f"update_{idx}"):
-                        st.session_state.matches.at[idx, 'Status'] = new_status
-                        st.session_state.matches.at[idx, 'StartDate'] = str(start_date)
-                        st.session_state.matches.at[idx, 'Session1'] = str(session1_date)
-                        st.success("Match updated!")
-                        st.rerun()
 
 # ==================== EMAIL SETTINGS PAGE ====================
 elif page == "📧 Email Settings":
@@ -811,6 +1566,9 @@ elif page == "📧 Email Settings":
                                     max_value=65535, 
                                     value=st.session_state.email_settings['smtp_port'])
 
+        use_ssl = st.checkbox("Use SSL (implicit TLS, typically port 465)",
+                              value=st.session_state.email_settings.get('use_ssl', False))
+
         sender_email = st.text_input("Sender Email Address", 
                                      value=st.session_state.email_settings['sender_email'],
                                      placeholder="your-email@gmail.com")
@@ -837,7 +1595,8 @@ elif page == "📧 Email Settings":
                 'smtp_port': smtp_port,
                 'sender_email': sender_email,
                 'sender_password': sender_password,
-                'use_email': use_email
+                'use_email': use_email,
+                'use_ssl': use_ssl
             }
             st.success("✅ Email settings saved successfully!")
             st.rerun()
@@ -847,28 +1606,16 @@ elif page == "📧 Email Settings":
                 st.error("Please enter a test email address")
             else:
                 try:
-                    msg = MIMEMultipart()
-                    msg['From'] = sender_email
-                    msg['To'] = test_email
-                    msg['Subject'] = "Test Email - RUN-InnoBoost Mentor Matching System"
-
-                    body = """
-This is a test email from the RUN-InnoBoost Mentor Matching System.
-
-If you received this email, your SMTP configuration is working correctly! ✅
-
-You can now enable automatic email notifications for mentor-mentee matches.
-
-Best regards,
-RUN-InnoBoost Team
-"""
-                    msg.attach(MIMEText(body, 'plain'))
-
-                    server = smtplib.SMTP(smtp_server, smtp_port)
-                    server.starttls()
-                    server.login(sender_email, sender_password)
+                    msg = _make_test_message(sender_email, test_email)
+
+                    # Reuse (or open) the session connection with the
+                    # form's values - it stays warm for later sends
+                    server = _get_smtp({'smtp_server': smtp_server,
+                                        'smtp_port': smtp_port,
+                                        'sender_email': sender_email,
+                                        'sender_password': sender_password,
+                                        'use_ssl': use_ssl})
                     server.send_message(msg)
-                    server.quit()
 
                     st.success(f"✅ Test email sent successfully to {test_email}!")
 
@@ -887,7 +1634,7 @@ elif page == "📤 Export Data":
     with col1:
         st.subheader("Mentors")
         if len(st.session_state.mentors) > 0:
-            csv_mentors = st.session_state.mentors.to_csv(index=False)
+            csv_mentors = _csv_bytes(_df_hash(st.session_state.mentors), st.session_state.mentors)
             st.download_button("📥 Download Mentors CSV", 
                              csv_mentors, 
                              "mentors.csv", 
@@ -898,7 +1645,7 @@ elif page == "📤 Export Data":
     with col2:
         st.subheader("Mentees")
         if len(st.session_state.mentees) > 0:
-            csv_mentees = st.session_state.mentees.to_csv(index=False)
+            csv_mentees = _csv_bytes(_df_hash(st.session_state.mentees), st.session_state.mentees)
             st.download_button("📥 Download Mentees CSV", 
                              csv_mentees, 
                              "mentees.csv", 
@@ -909,7 +1656,7 @@ elif page == "📤 Export Data":
     with col3:
         st.subheader("Matches")
         if len(st.session_state.matches) > 0:
-            csv_matches = st.session_state.matches.to_csv(index=False)
+            csv_matches = _csv_bytes(_df_hash(st.session_state.matches), st.session_state.matches)
             st.download_button("📥 Download Matches CSV", 
                              csv_matches, 
                              "matches.csv", 
@@ -922,15 +1669,12 @@ elif page == "📤 Export Data":
     # Export to Excel (all sheets)
     st.subheader("Complete Export")
     if st.button("📦 Generate Complete Excel Export"):
-        from io import BytesIO
-
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            st.session_state.mentors.to_excel(writer, sheet_name='Mentors', index=False)
-            st.session_state.mentees.to_excel(writer, sheet_name='Mentees', index=False)
-            st.session_state.matches.to_excel(writer, sheet_name='Matches', index=False)
-
-        excel_data = output.getvalue()
+        excel_data = _excel_bytes(_df_hash(st.session_state.mentors),
+                                  _df_hash(st.session_state.mentees),
+                                  _df_hash(st.session_state.matches),
+                                  st.session_state.mentors,
+                                  st.session_state.mentees,
+                                  st.session_state.matches)
 
         st.download_button(
             label="📥 Download Complete Excel File",